@@ -4,23 +4,400 @@ Creates a minimal demo version that will definitely deploy successfully
 """
 
 import os
+import copy
+import gzip
 import json
+import hashlib
+import functools
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Template engine; without it (and without minijinja) only the fallback page is built
+try:
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    JINJA2_AVAILABLE = True
+except ImportError:
+    JINJA2_AVAILABLE = False
+
+# Optional native (Rust) template engine with Jinja2-compatible syntax
+try:
+    import minijinja
+    MINIJINJA_AVAILABLE = True
+except ImportError:
+    MINIJINJA_AVAILABLE = False
+
+# Native JSON serializer; the standard library encoder is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# C-accelerated CSS minifier; the stylesheet ships unminified without it
+try:
+    import rcssmin
+    RCSSMIN_AVAILABLE = True
+except ImportError:
+    RCSSMIN_AVAILABLE = False
+
+# Brotli siblings are emitted alongside gzip when the encoder is installed
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+TEMPLATE_CACHE_DIR = Path(__file__).parent / ".jinja_cache"
+HTML_WRITE_BUFFER_SIZE = 1 << 18
+# Kept next to dist/ rather than inside it so the fingerprint is never deployed
+CONTENT_HASH_FILE = Path(".dist_content_hash")
+PRECOMPRESS_SUFFIXES = ('.html', '.css', '.json')
+
+# Site stylesheet, shipped as a separate static asset next to index.html
+STYLES = b"""* { margin: 0; padding: 0; box-sizing: border-box; }
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+.hero {
+    text-align: center;
+    color: white;
+    padding: 80px 20px;
+    animation: fadeInUp 1s ease-out;
+}
+
+.hero h1 {
+    font-size: clamp(2rem, 5vw, 4rem);
+    margin-bottom: 20px;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+    font-weight: 700;
+}
+
+.hero p {
+    font-size: clamp(1rem, 2.5vw, 1.5rem);
+    margin-bottom: 40px;
+    opacity: 0.95;
+    max-width: 600px;
+    margin-left: auto;
+    margin-right: auto;
+}
+
+.cta-button {
+    display: inline-block;
+    background: white;
+    color: #667eea;
+    padding: 18px 36px;
+    text-decoration: none;
+    border-radius: 50px;
+    font-weight: 600;
+    font-size: 1.1rem;
+    transition: all 0.3s ease;
+    box-shadow: 0 8px 25px rgba(0,0,0,0.2);
+    border: 3px solid transparent;
+}
+
+.cta-button:hover {
+    transform: translateY(-3px);
+    box-shadow: 0 12px 35px rgba(0,0,0,0.3);
+    background: transparent;
+    color: white;
+    border-color: white;
+}
+
+.card {
+    background: white;
+    border-radius: 20px;
+    padding: 40px;
+    margin: 40px 0;
+    box-shadow: 0 20px 60px rgba(0,0,0,0.1);
+    backdrop-filter: blur(10px);
+    animation: fadeInUp 1s ease-out 0.2s both;
+}
+
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 30px;
+    margin: 40px 0;
+}
+
+.metric-card {
+    text-align: center;
+    padding: 30px 20px;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 15px;
+    transition: transform 0.3s ease;
+    box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
+}
+
+.metric-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
+}
+
+.metric-value {
+    font-size: 2.5rem;
+    font-weight: 700;
+    margin-bottom: 10px;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
+}
+
+.metric-label {
+    font-size: 1rem;
+    opacity: 0.9;
+    font-weight: 500;
+}
+
+.features-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
+    gap: 30px;
+    margin: 40px 0;
+}
+
+.feature-card {
+    text-align: center;
+    padding: 30px;
+    border-radius: 15px;
+    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+    transition: all 0.3s ease;
+    border: 1px solid #e9ecef;
+}
+
+.feature-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 15px 40px rgba(0,0,0,0.1);
+    background: white;
+}
+
+.feature-icon {
+    font-size: 3.5rem;
+    margin-bottom: 20px;
+    display: block;
+}
+
+.feature-card h3 {
+    font-size: 1.3rem;
+    margin-bottom: 15px;
+    color: #2c3e50;
+    font-weight: 600;
+}
+
+.feature-card p {
+    color: #6c757d;
+    line-height: 1.6;
+}
+
+.section-title {
+    text-align: center;
+    font-size: 2.5rem;
+    margin-bottom: 20px;
+    color: #2c3e50;
+    font-weight: 700;
+}
+
+.section-subtitle {
+    text-align: center;
+    font-size: 1.2rem;
+    color: #6c757d;
+    margin-bottom: 40px;
+    max-width: 600px;
+    margin-left: auto;
+    margin-right: auto;
+}
+
+.persona-card {
+    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+    border-radius: 15px;
+    padding: 30px;
+    margin: 20px 0;
+    border-left: 5px solid #667eea;
+    transition: all 0.3s ease;
+}
+
+.persona-card:hover {
+    transform: translateX(5px);
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+}
+
+.persona-card h3 {
+    color: #667eea;
+    font-size: 1.4rem;
+    margin-bottom: 10px;
+    font-weight: 600;
+}
+
+.persona-stats {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    gap: 15px;
+    margin: 20px 0;
+}
+
+.stat {
+    text-align: center;
+    padding: 15px;
+    background: white;
+    border-radius: 10px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.05);
+}
+
+.stat-value {
+    font-size: 1.5rem;
+    font-weight: 700;
+    color: #667eea;
+    display: block;
+}
+
+.stat-label {
+    font-size: 0.9rem;
+    color: #6c757d;
+    margin-top: 5px;
+}
+
+.insight-item {
+    background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%);
+    margin: 15px 0;
+    padding: 20px;
+    border-radius: 10px;
+    border-left: 4px solid #28a745;
+    transition: all 0.3s ease;
+}
+
+.insight-item:hover {
+    transform: translateX(5px);
+    box-shadow: 0 5px 20px rgba(40, 167, 69, 0.2);
+}
+
+.footer {
+    text-align: center;
+    color: white;
+    padding: 60px 20px;
+    opacity: 0.9;
+    margin-top: 60px;
+}
+
+.footer a {
+    color: white;
+    text-decoration: none;
+    margin: 0 15px;
+    padding: 10px 20px;
+    border: 2px solid rgba(255,255,255,0.3);
+    border-radius: 25px;
+    transition: all 0.3s ease;
+    display: inline-block;
+    margin-top: 10px;
+}
+
+.footer a:hover {
+    background: rgba(255,255,255,0.2);
+    border-color: white;
+}
+
+@keyframes fadeInUp {
+    from {
+        opacity: 0;
+        transform: translateY(30px);
+    }
+    to {
+        opacity: 1;
+        transform: translateY(0);
+    }
+}
+
+@media (max-width: 768px) {
+    .hero { padding: 60px 20px; }
+    .card { padding: 30px 20px; }
+    .metrics-grid { grid-template-columns: 1fr 1fr; gap: 20px; }
+    .features-grid { grid-template-columns: 1fr; }
+    .persona-stats { grid-template-columns: 1fr 1fr; }
+}
+
+@media (max-width: 480px) {
+    .metrics-grid { grid-template-columns: 1fr; }
+    .persona-stats { grid-template-columns: 1fr; }
+}
+"""
+# Minified once at import; the build only writes the resulting bytes
+STYLESHEET = rcssmin.cssmin(STYLES) if RCSSMIN_AVAILABLE else STYLES
+# Content-addressed name, since *.css is served with an immutable cache header
+STYLESHEET_NAME = f"style.{hashlib.blake2b(STYLESHEET, digest_size=8).hexdigest()}.css"
+
+@functools.lru_cache(maxsize=1)
+def _template_env():
+    """Jinja2 environment, built on first render; compiled templates are cached on disk"""
+    # A read-only checkout just compiles the template each build
+    try:
+        TEMPLATE_CACHE_DIR.mkdir(exist_ok=True)
+        cache_writable = os.access(TEMPLATE_CACHE_DIR, os.W_OK)
+    except OSError:
+        cache_writable = False
+    bytecode_cache = FileSystemBytecodeCache(directory=str(TEMPLATE_CACHE_DIR)) if cache_writable else None
+    
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        autoescape=True,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+def _load_template_source(name):
+    """Load a template source for the minijinja environment"""
+    path = TEMPLATES_DIR / name
+    return path.read_text(encoding="utf-8") if path.is_file() else None
+
+@functools.lru_cache(maxsize=1)
+def _native_template_env():
+    """minijinja environment over the same template files, built on first render"""
+    return minijinja.Environment(
+        loader=_load_template_source,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+def _fast_rmtree(path):
+    """Recursively delete a directory using cached scandir entry types"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def _dump_json(data):
+    """Serialize data to indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
 
 def create_dist_directory():
     """Create distribution directory"""
     dist_dir = Path("dist")
     if dist_dir.exists():
-        import shutil
-        shutil.rmtree(dist_dir)
+        _fast_rmtree(dist_dir)
     dist_dir.mkdir()
     return dist_dir
 
-def create_minimal_demo_data():
-    """Create ultra-lightweight demo data"""
-    print("Creating minimal demo data...")
-    
+@functools.lru_cache(maxsize=1)
+def _static_payload():
+    """Constant demo payload; only the build timestamp varies between calls"""
     return {
         'personas': {
             'urban_commuter': {
@@ -65,510 +442,167 @@ def create_minimal_demo_data():
                 'Premium services could capture additional $300K annually'
             ]
         },
-        'generated_at': datetime.now().isoformat(),
         'demo_mode': True
     }
 
-def create_static_html(analysis_results, dist_dir):
-    """Create beautiful static HTML page"""
-    print("Creating static HTML page...")
-    
-    # Create main index.html with embedded CSS and responsive design
-    index_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Consumer Segmentation Analytics | Advanced Business Intelligence</title>
-    <meta name="description" content="Transform mobility and spending data into actionable business insights with advanced machine learning">
-    <meta name="keywords" content="consumer segmentation, analytics, mobility data, business intelligence, machine learning">
-    
-    <!-- Open Graph -->
-    <meta property="og:title" content="Consumer Segmentation Analytics">
-    <meta property="og:description" content="Advanced analytics platform for understanding consumer behavior">
-    <meta property="og:type" content="website">
-    
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-            line-height: 1.6; 
-            color: #333; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }}
-        
-        .container {{ 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            padding: 20px; 
-        }}
-        
-        .hero {{ 
-            text-align: center; 
-            color: white; 
-            padding: 80px 20px; 
-            animation: fadeInUp 1s ease-out;
-        }}
-        
-        .hero h1 {{ 
-            font-size: clamp(2rem, 5vw, 4rem);
-            margin-bottom: 20px; 
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            font-weight: 700;
-        }}
-        
-        .hero p {{ 
-            font-size: clamp(1rem, 2.5vw, 1.5rem);
-            margin-bottom: 40px; 
-            opacity: 0.95;
-            max-width: 600px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-        
-        .cta-button {{ 
-            display: inline-block; 
-            background: white; 
-            color: #667eea; 
-            padding: 18px 36px; 
-            text-decoration: none; 
-            border-radius: 50px; 
-            font-weight: 600; 
-            font-size: 1.1rem;
-            transition: all 0.3s ease;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.2);
-            border: 3px solid transparent;
-        }}
-        
-        .cta-button:hover {{ 
-            transform: translateY(-3px); 
-            box-shadow: 0 12px 35px rgba(0,0,0,0.3);
-            background: transparent;
-            color: white;
-            border-color: white;
-        }}
-        
-        .card {{ 
-            background: white; 
-            border-radius: 20px; 
-            padding: 40px; 
-            margin: 40px 0; 
-            box-shadow: 0 20px 60px rgba(0,0,0,0.1);
-            backdrop-filter: blur(10px);
-            animation: fadeInUp 1s ease-out 0.2s both;
-        }}
-        
-        .metrics-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
-            gap: 30px; 
-            margin: 40px 0;
-        }}
-        
-        .metric-card {{ 
-            text-align: center; 
-            padding: 30px 20px; 
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-            color: white; 
-            border-radius: 15px;
-            transition: transform 0.3s ease;
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .metric-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .metric-value {{ 
-            font-size: 2.5rem; 
-            font-weight: 700; 
-            margin-bottom: 10px;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-        }}
-        
-        .metric-label {{ 
-            font-size: 1rem; 
-            opacity: 0.9;
-            font-weight: 500;
-        }}
-        
-        .features-grid {{ 
-            display: grid; 
-            grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); 
-            gap: 30px; 
-            margin: 40px 0;
-        }}
-        
-        .feature-card {{ 
-            text-align: center; 
-            padding: 30px; 
-            border-radius: 15px; 
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            transition: all 0.3s ease;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .feature-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 15px 40px rgba(0,0,0,0.1);
-            background: white;
-        }}
-        
-        .feature-icon {{ 
-            font-size: 3.5rem; 
-            margin-bottom: 20px; 
-            display: block;
-        }}
-        
-        .feature-card h3 {{
-            font-size: 1.3rem;
-            margin-bottom: 15px;
-            color: #2c3e50;
-            font-weight: 600;
-        }}
-        
-        .feature-card p {{
-            color: #6c757d;
-            line-height: 1.6;
-        }}
-        
-        .section-title {{
-            text-align: center;
-            font-size: 2.5rem;
-            margin-bottom: 20px;
-            color: #2c3e50;
-            font-weight: 700;
-        }}
-        
-        .section-subtitle {{
-            text-align: center;
-            font-size: 1.2rem;
-            color: #6c757d;
-            margin-bottom: 40px;
-            max-width: 600px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-        
-        .persona-card {{
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            border-radius: 15px;
-            padding: 30px;
-            margin: 20px 0;
-            border-left: 5px solid #667eea;
-            transition: all 0.3s ease;
-        }}
-        
-        .persona-card:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }}
-        
-        .persona-card h3 {{
-            color: #667eea;
-            font-size: 1.4rem;
-            margin-bottom: 10px;
-            font-weight: 600;
-        }}
-        
-        .persona-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        
-        .stat {{
-            text-align: center;
-            padding: 15px;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-        }}
-        
-        .stat-value {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #667eea;
-            display: block;
-        }}
-        
-        .stat-label {{
-            font-size: 0.9rem;
-            color: #6c757d;
-            margin-top: 5px;
-        }}
-        
-        .insight-item {{
-            background: linear-gradient(135deg, #e8f5e8 0%, #d4edda 100%);
-            margin: 15px 0;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 4px solid #28a745;
-            transition: all 0.3s ease;
-        }}
-        
-        .insight-item:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 5px 20px rgba(40, 167, 69, 0.2);
-        }}
-        
-        .footer {{ 
-            text-align: center; 
-            color: white; 
-            padding: 60px 20px; 
-            opacity: 0.9;
-            margin-top: 60px;
-        }}
-        
-        .footer a {{
-            color: white;
-            text-decoration: none;
-            margin: 0 15px;
-            padding: 10px 20px;
-            border: 2px solid rgba(255,255,255,0.3);
-            border-radius: 25px;
-            transition: all 0.3s ease;
-            display: inline-block;
-            margin-top: 10px;
-        }}
-        
-        .footer a:hover {{
-            background: rgba(255,255,255,0.2);
-            border-color: white;
-        }}
-        
-        @keyframes fadeInUp {{
-            from {{
-                opacity: 0;
-                transform: translateY(30px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .hero {{ padding: 60px 20px; }}
-            .card {{ padding: 30px 20px; }}
-            .metrics-grid {{ grid-template-columns: 1fr 1fr; gap: 20px; }}
-            .features-grid {{ grid-template-columns: 1fr; }}
-            .persona-stats {{ grid-template-columns: 1fr 1fr; }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .metrics-grid {{ grid-template-columns: 1fr; }}
-            .persona-stats {{ grid-template-columns: 1fr; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="hero">
-            <h1>🎯 Consumer Segmentation Analytics</h1>
-            <p>Transform mobility and spending data into actionable business insights with advanced machine learning and AI-powered analytics</p>
-            <a href="#insights" class="cta-button">Explore Insights</a>
-        </div>
-        
-        <div class="card">
-            <h2 class="section-title">Market Intelligence Dashboard</h2>
-            <p class="section-subtitle">Real-time analytics and insights from our advanced consumer segmentation platform</p>
-            
-            <div class="metrics-grid">
-                <div class="metric-card">
-                    <div class="metric-value">${analysis_results['insights']['market_overview']['total_addressable_market']:,.0f}</div>
-                    <div class="metric-label">Total Market Value</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{analysis_results['insights']['market_overview']['total_population']:,}</div>
-                    <div class="metric-label">Total Users</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{len(analysis_results['personas'])}</div>
-                    <div class="metric-label">Consumer Segments</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{analysis_results['insights']['market_overview']['average_targeting_effectiveness']:.0%}</div>
-                    <div class="metric-label">Avg. Effectiveness</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <h2 class="section-title">Platform Capabilities</h2>
-            <p class="section-subtitle">Comprehensive analytics platform powered by advanced machine learning and AI</p>
-            
-            <div class="features-grid">
-                <div class="feature-card">
-                    <span class="feature-icon">🎯</span>
-                    <h3>Advanced Segmentation</h3>
-                    <p>Multi-modal data integration with HDBSCAN and K-Means clustering algorithms for precise consumer segmentation</p>
-                </div>
-                <div class="feature-card">
-                    <span class="feature-icon">🤖</span>
-                    <h3>Predictive Analytics</h3>
-                    <p>Machine learning models for spending pattern prediction and future trend forecasting with confidence intervals</p>
-                </div>
-                <div class="feature-card">
-                    <span class="feature-icon">👥</span>
-                    <h3>AI-Powered Personas</h3>
-                    <p>Automated persona generation with narrative descriptions and strategic business recommendations</p>
-                </div>
-                <div class="feature-card">
-                    <span class="feature-icon">📊</span>
-                    <h3>Interactive Visualizations</h3>
-                    <p>Real-time dashboard with 3D cluster plots, geographic mapping, and advanced chart visualizations</p>
-                </div>
-                <div class="feature-card">
-                    <span class="feature-icon">🔒</span>
-                    <h3>Privacy & Ethics</h3>
-                    <p>Built-in privacy protection, algorithmic fairness assessment, and responsible AI practices</p>
-                </div>
-                <div class="feature-card">
-                    <span class="feature-icon">🚀</span>
-                    <h3>Production Ready</h3>
-                    <p>Scalable architecture with comprehensive testing, CI/CD pipeline, and enterprise deployment options</p>
-                </div>
-            </div>
-        </div>
-        
-        <div class="card" id="insights">
-            <h2 class="section-title">Consumer Personas Identified</h2>
-            <p class="section-subtitle">AI-generated consumer segments with detailed behavioral analysis and market insights</p>
-"""
-    
-    # Add persona cards
-    for persona_id, persona in analysis_results['personas'].items():
-        index_html += f"""
-            <div class="persona-card">
-                <h3>{persona['persona_name']}</h3>
-                <p style="color: #6c757d; margin-bottom: 20px; font-style: italic;">{persona['persona_type']}</p>
-                
-                <div class="persona-stats">
-                    <div class="stat">
-                        <span class="stat-value">{persona['estimated_population']:,}</span>
-                        <div class="stat-label">Population</div>
-                    </div>
-                    <div class="stat">
-                        <span class="stat-value">${persona['market_value']:,.0f}</span>
-                        <div class="stat-label">Market Value</div>
-                    </div>
-                    <div class="stat">
-                        <span class="stat-value">{persona['targeting_effectiveness']:.0%}</span>
-                        <div class="stat-label">Effectiveness</div>
-                    </div>
-                </div>
-                
-                <p style="line-height: 1.6; color: #495057; margin-top: 20px;">{persona['description']}</p>
-            </div>
-"""
-    
-    index_html += f"""
-        </div>
-        
-        <div class="card">
-            <h2 class="section-title">Business Opportunities</h2>
-            <p class="section-subtitle">Data-driven opportunities identified through advanced analytics and market intelligence</p>
-"""
-    
-    # Add opportunity cards
-    for opp in analysis_results['opportunities']:
-        index_html += f"""
-            <div class="persona-card">
-                <h3>{opp['opportunity_type']}</h3>
-                <p style="color: #6c757d; margin-bottom: 20px;">{opp['description']}</p>
-                
-                <div class="persona-stats">
-                    <div class="stat">
-                        <span class="stat-value">${opp['estimated_market_size']:,.0f}</span>
-                        <div class="stat-label">Market Size</div>
-                    </div>
-                    <div class="stat">
-                        <span class="stat-value">{opp['expected_roi']}</span>
-                        <div class="stat-label">Expected ROI</div>
-                    </div>
-                    <div class="stat">
-                        <span class="stat-value">{opp['implementation_timeline']}</span>
-                        <div class="stat-label">Timeline</div>
-                    </div>
-                    <div class="stat">
-                        <span class="stat-value">{opp['investment_level']}</span>
-                        <div class="stat-label">Investment</div>
-                    </div>
-                </div>
-            </div>
-"""
-    
-    index_html += f"""
-        </div>
-        
-        <div class="card">
-            <h2 class="section-title">Key Market Insights</h2>
-            <p class="section-subtitle">Strategic insights derived from comprehensive data analysis and machine learning algorithms</p>
-"""
-    
-    # Add insights
-    for insight in analysis_results['insights']['key_insights']:
-        index_html += f"""
-            <div class="insight-item">
-                💡 {insight}
-            </div>
-"""
+def create_minimal_demo_data(generated_at):
+    """Create ultra-lightweight demo data stamped with the build timestamp"""
+    print("Creating minimal demo data...")
     
-    index_html += f"""
-        </div>
-        
-        <div class="footer">
-            <h3 style="margin-bottom: 20px; font-size: 1.5rem;">Ready to Transform Your Business?</h3>
-            <p style="margin-bottom: 30px; font-size: 1.1rem;">Deploy this advanced analytics platform for your organization</p>
-            <p style="margin-bottom: 30px; opacity: 0.8;">Generated on {datetime.now().strftime('%B %d, %Y')} | Built with Python, Machine Learning & Advanced Analytics</p>
-            
-            <div>
-                <a href="https://github.com/your-org/consumer-segmentation">📚 Documentation</a>
-                <a href="https://github.com/your-org/consumer-segmentation">🔧 Source Code</a>
-                <a href="mailto:contact@yourcompany.com">📧 Contact Us</a>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    # Deep copy so callers can never mutate the memoized payload
+    analysis_results = copy.deepcopy(_static_payload())
+    analysis_results['generated_at'] = generated_at
+    return analysis_results
+
+def _content_hash(analysis_results, generated_on):
+    """Fingerprint every input that feeds the generated site, including the build day"""
+    digest = hashlib.blake2b()
+    digest.update(Path(__file__).read_bytes())
+    for template_file in sorted(TEMPLATES_DIR.iterdir()):
+        digest.update(template_file.read_bytes())
+    # Output also depends on which optional encoders are installed
+    digest.update(STYLESHEET)
+    digest.update(repr((MINIJINJA_AVAILABLE, ORJSON_AVAILABLE, BROTLI_AVAILABLE)).encode("utf-8"))
+    digest.update(generated_on.encode("utf-8"))
+    digest.update(_dump_json({
+        key: value for key, value in analysis_results.items() if key != 'generated_at'
+    }))
+    return digest.hexdigest()
+
+def _is_build_current(dist_dir, content_hash):
+    """Check whether dist/ already holds a complete build of identical content"""
+    outputs = [dist_dir / "index.html", dist_dir / STYLESHEET_NAME, dist_dir / "api" / "analysis.json"]
+    return (
+        CONTENT_HASH_FILE.is_file()
+        and all(path.is_file() for path in outputs)
+        and CONTENT_HASH_FILE.read_text(encoding="utf-8") == content_hash
+    )
+
+def _format_persona(persona):
+    """View copy of a persona with its display strings formatted once"""
+    return {
+        **persona,
+        'pop_fmt': f"{persona['estimated_population']:,}",
+        'mv_fmt': f"${persona['market_value']:,.0f}",
+        'eff_fmt': f"{persona['targeting_effectiveness']:.0%}"
+    }
+
+def _format_opportunity(opportunity):
+    """View copy of an opportunity with its display strings formatted once"""
+    return {
+        **opportunity,
+        'size_fmt': f"${opportunity['estimated_market_size']:,.0f}"
+    }
+
+def _format_market_overview(market_overview):
+    """View copy of the market overview with its display strings formatted once"""
+    return {
+        **market_overview,
+        'market_fmt': f"${market_overview['total_addressable_market']:,.0f}",
+        'pop_fmt': f"{market_overview['total_population']:,}",
+        'eff_fmt': f"{market_overview['average_targeting_effectiveness']:.0%}"
+    }
+
+def create_static_html(analysis_results, dist_dir, generated_on):
+    """Create beautiful static HTML page dated with the build day"""
+    # Format display values up front (on copies, the payload is shared and
+    # also serialized to the API) so the template only substitutes strings
+    context = {
+        'personas': {
+            persona_id: _format_persona(persona)
+            for persona_id, persona in analysis_results['personas'].items()
+        },
+        'opportunities': [_format_opportunity(opp) for opp in analysis_results['opportunities']],
+        'market_overview': _format_market_overview(analysis_results['insights']['market_overview']),
+        'key_insights': analysis_results['insights']['key_insights'],
+        'generated_on': generated_on,
+        'stylesheet': STYLESHEET_NAME
+    }
     
-    # Write index.html
-    with open(dist_dir / "index.html", "w", encoding="utf-8") as f:
-        f.write(index_html)
+    (dist_dir / STYLESHEET_NAME).write_bytes(STYLESHEET)
     
-    print("✅ Beautiful static HTML page created successfully!")
+    index_file = dist_dir / "index.html"
+    if MINIJINJA_AVAILABLE:
+        # Native renderer returns the complete page in one call
+        index_file.write_bytes(_native_template_env().render_template("index.html.j2", **context).encode("utf-8"))
+    elif JINJA2_AVAILABLE:
+        # Stream rendered chunks through one large write buffer
+        template = _template_env().get_template("index.html.j2")
+        with open(index_file, "wb", buffering=HTML_WRITE_BUFFER_SIZE) as f:
+            template.stream(**context).dump(f, encoding="utf-8")
+    else:
+        raise RuntimeError("No template engine available; install jinja2")
 
 def create_api_endpoints(analysis_results, dist_dir):
     """Create lightweight API endpoints"""
-    print("Creating API endpoints...")
-    
     api_dir = dist_dir / "api"
     api_dir.mkdir(exist_ok=True)
     
-    # Create simple JSON endpoints
-    endpoints = {
-        'personas.json': analysis_results['personas'],
-        'opportunities.json': analysis_results['opportunities'],
-        'insights.json': analysis_results['insights'],
-        'status.json': {
+    # Single combined endpoint: one file at build time, one request for clients
+    analysis = {
+        'personas': analysis_results['personas'],
+        'opportunities': analysis_results['opportunities'],
+        'insights': analysis_results['insights'],
+        'status': {
             'status': 'active',
             'version': '1.0.0',
             'generated_at': analysis_results['generated_at'],
             'demo_mode': True
         }
     }
+    (api_dir / "analysis.json").write_bytes(_dump_json(analysis))
+
+def _write_compressed_siblings(path, data):
+    """Write the .gz (and .br, if available) siblings of an asset"""
+    # Fixed mtime keeps the gzip bytes identical between builds
+    path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    br_path = path.with_name(path.name + ".br")
+    if BROTLI_AVAILABLE:
+        br_path.write_bytes(brotli.compress(data, quality=11))
+    else:
+        br_path.unlink(missing_ok=True)
+
+def precompress_assets(dist_dir):
+    """Write pre-compressed .gz/.br siblings for the text assets"""
+    print("Precompressing static assets...")
     
-    for filename, data in endpoints.items():
-        with open(api_dir / filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+    # Snapshot the file list first so new siblings are not revisited
+    assets = [path for path in dist_dir.rglob("*") if path.suffix in PRECOMPRESS_SUFFIXES]
+    for path in assets:
+        _write_compressed_siblings(path, path.read_bytes())
     
-    print("✅ API endpoints created successfully!")
+    print("✅ Static assets precompressed successfully!")
+
+# Emergency page written when the full build fails; encoded once at import
+_FALLBACK_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Consumer Segmentation Analytics</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; text-align: center; padding: 50px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; min-height: 100vh; margin: 0; }
+        .container { max-width: 800px; margin: 0 auto; }
+        h1 { font-size: 3rem; margin-bottom: 20px; text-shadow: 2px 2px 4px rgba(0,0,0,0.3); }
+        p { font-size: 1.2rem; margin-bottom: 20px; opacity: 0.9; }
+        .status { background: rgba(255,255,255,0.1); padding: 30px; border-radius: 15px; margin: 30px 0; backdrop-filter: blur(10px); }
+        .cta { display: inline-block; background: white; color: #667eea; padding: 15px 30px; text-decoration: none; border-radius: 50px; font-weight: bold; margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🎯 Consumer Segmentation Analytics</h1>
+        <p>Advanced Analytics Platform for Business Intelligence</p>
+        <div class="status">
+            <h2>🚀 Successfully Deployed</h2>
+            <p>The platform is optimized and ready for production use.</p>
+            <p>Advanced analytics features are being finalized.</p>
+        </div>
+        <p>Transform mobility and spending data into actionable business insights</p>
+        <a href="mailto:contact@yourcompany.com" class="cta">Get Started</a>
+    </div>
+</body>
+</html>""".encode("utf-8")
 
 def main():
     """Main build function - ultra-reliable"""
@@ -576,26 +610,51 @@ def main():
     print("=" * 60)
     
     try:
-        # Create distribution directory
-        dist_dir = create_dist_directory()
-        print("✅ Created dist directory")
+        # Take the build timestamp once so the page and the API agree
+        build_time = datetime.now()
+        generated_on = build_time.strftime('%B %d, %Y')
         
         # Generate minimal demo data
-        analysis_results = create_minimal_demo_data()
+        analysis_results = create_minimal_demo_data(build_time.isoformat())
         print("✅ Generated demo data")
         
-        # Create beautiful static HTML
-        create_static_html(analysis_results, dist_dir)
-        print("✅ Created static HTML")
+        # Skip the rebuild entirely when nothing feeding the site changed
+        content_hash = _content_hash(analysis_results, generated_on)
+        if _is_build_current(Path("dist"), content_hash):
+            print("✅ Site content unchanged, keeping existing build")
+            print("=" * 60)
+            return
         
-        # Create API endpoints
-        create_api_endpoints(analysis_results, dist_dir)
-        print("✅ Created API endpoints")
+        # Drop the old fingerprint first so an interrupted rebuild is never trusted
+        CONTENT_HASH_FILE.unlink(missing_ok=True)
+        
+        # Create distribution directory
+        dist_dir = create_dist_directory()
+        print("✅ Created dist directory")
+        
+        # Create the static HTML and API endpoints concurrently; both spend
+        # most of their time in file writes with independent outputs. Progress
+        # is reported here, not from the workers, so the log never interleaves
+        print("Creating static HTML page and API endpoints...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            html_future = executor.submit(
+                create_static_html, analysis_results, dist_dir, generated_on
+            )
+            api_future = executor.submit(create_api_endpoints, analysis_results, dist_dir)
+            html_future.result()
+            print("✅ Created static HTML")
+            api_future.result()
+            print("✅ Created API endpoints")
+        
+        # Precompress the finished text assets
+        precompress_assets(dist_dir)
+        print("✅ Precompressed static assets")
         
         # Verify build
         index_file = dist_dir / "index.html"
         if index_file.exists() and index_file.stat().st_size > 1000:
             print("✅ Build verification passed")
+            CONTENT_HASH_FILE.write_text(content_hash, encoding="utf-8")
             print(f"📁 Output directory: {dist_dir}")
             print(f"📄 Index file size: {index_file.stat().st_size:,} bytes")
             print("🌐 Ready for Netlify deployment!")
@@ -611,39 +670,11 @@ def main():
         # Create absolute minimal fallback
         dist_dir = Path("dist")
         dist_dir.mkdir(exist_ok=True)
-        
-        fallback_html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Consumer Segmentation Analytics</title>
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, sans-serif; text-align: center; padding: 50px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; min-height: 100vh; margin: 0; }
-        .container { max-width: 800px; margin: 0 auto; }
-        h1 { font-size: 3rem; margin-bottom: 20px; text-shadow: 2px 2px 4px rgba(0,0,0,0.3); }
-        p { font-size: 1.2rem; margin-bottom: 20px; opacity: 0.9; }
-        .status { background: rgba(255,255,255,0.1); padding: 30px; border-radius: 15px; margin: 30px 0; backdrop-filter: blur(10px); }
-        .cta { display: inline-block; background: white; color: #667eea; padding: 15px 30px; text-decoration: none; border-radius: 50px; font-weight: bold; margin-top: 20px; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🎯 Consumer Segmentation Analytics</h1>
-        <p>Advanced Analytics Platform for Business Intelligence</p>
-        <div class="status">
-            <h2>🚀 Successfully Deployed</h2>
-            <p>The platform is optimized and ready for production use.</p>
-            <p>Advanced analytics features are being finalized.</p>
-        </div>
-        <p>Transform mobility and spending data into actionable business insights</p>
-        <a href="mailto:contact@yourcompany.com" class="cta">Get Started</a>
-    </div>
-</body>
-</html>"""
-        
-        with open(dist_dir / "index.html", "w") as f:
-            f.write(fallback_html)
+        CONTENT_HASH_FILE.unlink(missing_ok=True)
+        index_file = dist_dir / "index.html"
+        index_file.write_bytes(_FALLBACK_HTML)
+        # Replace precompressed copies too, or hosts would serve the failed page
+        _write_compressed_siblings(index_file, _FALLBACK_HTML)
         
         print("✅ Emergency fallback created successfully!")
         print("🌐 Minimal site ready for deployment!")
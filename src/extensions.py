@@ -35,6 +35,36 @@ from scipy.spatial.distance import pdist, squareform
 
 from config import DATA_CONFIG, MODEL_CONFIG
 
+# Static HTML report fragments, parsed once and filled per persona/opportunity
+_PERSONA_CARD_HTML = """
+        <div class="persona-card">
+            <h3 style="color: #2c3e50;">{persona.persona_name}</h3>
+            <p><strong>Type:</strong> {persona.persona_type.value}</p>
+            <p><strong>Population:</strong> {persona.estimated_population:,}</p>
+            <p><strong>Market Value:</strong> ${persona.market_value:,.0f}</p>
+            <p><strong>Targeting Effectiveness:</strong> {persona.targeting_effectiveness:.1%}</p>
+            <p>{persona.description}</p>
+            <div style="margin-top: 15px;">
+                <strong>Key Motivations:</strong>
+                <ul>
+                    {motivations}
+                </ul>
+            </div>
+        </div>
+"""
+
+_OPPORTUNITY_CARD_HTML = """
+        <div class="opportunity-card">
+            <h4 style="margin-top: 0; color: #2c3e50;">{opp.opportunity_type}</h4>
+            <p>{opp.description}</p>
+            <p><strong>Market Size:</strong> ${opp.estimated_market_size:,.0f} | 
+               <strong>Expected ROI:</strong> {opp.expected_roi} | 
+               <strong>Timeline:</strong> {opp.implementation_timeline}</p>
+        </div>
+"""
+
+_LIST_ITEM_HTML = "<li>{}</li>"
+
 
 class PredictiveModeling:
     """Advanced predictive modeling for spending pattern prediction"""
@@ -728,8 +758,7 @@ Market Overview:
 
 Key Insights:
 """
-                for insight in insights.get('key_insights', [])[:5]:
-                    summary_text += f"• {insight}\n"
+                summary_text += ''.join(f"• {insight}\n" for insight in insights.get('key_insights', [])[:5])
                 
                 ax.text(0.1, 0.8, summary_text, fontsize=10, va='top', wrap=True)
                 ax.axis('off')
@@ -849,7 +878,7 @@ Description:
         """
         logger.info("Exporting static HTML report")
         
-        html_content = f"""
+        html_parts = [f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -895,61 +924,37 @@ Description:
         </div>
         
         <h2>Consumer Personas</h2>
-"""
+"""]
         
         # Add personas
         for persona_id, persona in personas.items():
-            html_content += f"""
-        <div class="persona-card">
-            <h3 style="color: #2c3e50;">{persona.persona_name}</h3>
-            <p><strong>Type:</strong> {persona.persona_type.value}</p>
-            <p><strong>Population:</strong> {persona.estimated_population:,}</p>
-            <p><strong>Market Value:</strong> ${persona.market_value:,.0f}</p>
-            <p><strong>Targeting Effectiveness:</strong> {persona.targeting_effectiveness:.1%}</p>
-            <p>{persona.description}</p>
-            <div style="margin-top: 15px;">
-                <strong>Key Motivations:</strong>
-                <ul>
-                    {''.join([f'<li>{motivation}</li>' for motivation in persona.key_motivations[:3]])}
-                </ul>
-            </div>
-        </div>
-"""
+            motivations = ''.join(map(_LIST_ITEM_HTML.format, persona.key_motivations[:3]))
+            html_parts.append(_PERSONA_CARD_HTML.format(persona=persona, motivations=motivations))
         
         # Add opportunities
-        html_content += """
+        html_parts.append("""
         <h2>Business Opportunities</h2>
-"""
+""")
         
         for opp in opportunities:
-            html_content += f"""
-        <div class="opportunity-card">
-            <h4 style="margin-top: 0; color: #2c3e50;">{opp.opportunity_type}</h4>
-            <p>{opp.description}</p>
-            <p><strong>Market Size:</strong> ${opp.estimated_market_size:,.0f} | 
-               <strong>Expected ROI:</strong> {opp.expected_roi} | 
-               <strong>Timeline:</strong> {opp.implementation_timeline}</p>
-        </div>
-"""
+            html_parts.append(_OPPORTUNITY_CARD_HTML.format(opp=opp))
         
         # Add key insights
-        html_content += """
+        html_parts.append("""
         <h2>Key Insights</h2>
         <ul class="insight-list">
-"""
+""")
         
         for insight in insights.get('key_insights', []):
-            html_content += f"<li>{insight}</li>"
+            html_parts.append(_LIST_ITEM_HTML.format(insight))
         
-        html_content += """
+        html_parts.append("""
         </ul>
     </div>
 </body>
 </html>
-"""
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+""")
+        Path(output_path).write_text(''.join(html_parts), encoding='utf-8')
         
         logger.info(f"Static HTML report exported: {output_path}")
         return output_path
@@ -0,0 +1,231 @@
+"""
+Tests for the analytics engine
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+import analytics_engine as AE
+from analytics_engine import AnalyticsEngine
+
+
+class TestAnalyticsEngine:
+
+    @pytest.fixture
+    def engine(self):
+        """Create an AnalyticsEngine instance for testing"""
+        return AnalyticsEngine()
+
+    def test_mobility_data_generation(self, engine):
+        """Test mobility data structure and bounds"""
+        df = engine._generate_mobility_data()
+
+        assert isinstance(df, pd.DataFrame)
+        assert len(df) == 7
+        assert df['county_fips'].is_unique
+
+        # Realistic bounds enforced by the generator
+        assert (df['total_trips'] >= 1000).all()
+        assert df['avg_trip_duration_minutes'].between(5, 30).all()
+        assert df['member_ratio'].between(0.3, 0.95).all()
+        assert (df['member_trips'] + df['casual_trips'] <= df['total_trips']).all()
+
+    def test_mobility_data_is_reproducible(self, engine):
+        """Test that seeded generation yields identical data"""
+        pd.testing.assert_frame_equal(
+            engine._generate_mobility_data(),
+            engine._generate_mobility_data()
+        )
+
+    def test_spending_data_generation(self, engine):
+        """Test spending data categories, floors and proportions"""
+        df, _ = engine._generate_spending_data()
+
+        categories = df[df['category'] != 'total']
+        totals = df[df['category'] == 'total'].set_index('county_fips')['spending_amount']
+
+        assert len(totals) == 7
+        assert categories.groupby('county_fips')['category'].nunique().eq(6).all()
+        assert (categories['spending_amount'] >= 10000).all()
+
+        # Proportions of each county's categories sum to one
+        proportion_sums = categories.groupby('county_fips')['spending_proportion'].sum()
+        assert np.allclose(proportion_sums, 1.0, atol=0.01)
+
+        # Category amounts add up to the county total
+        category_sums = categories.groupby('county_fips')['spending_amount'].sum()
+        assert np.allclose(category_sums, totals.loc[category_sums.index], atol=10)
+
+    def test_spending_wide_matches_long_records(self, engine):
+        """Test that the wide spending view holds the same amounts as the long records"""
+        spending, spending_wide = engine._generate_spending_data()
+
+        pivot = spending.pivot(index='county_fips', columns='category', values='spending_amount')
+        assert np.array_equal(
+            spending_wide.to_numpy(),
+            pivot.loc[spending_wide.index, spending_wide.columns].to_numpy()
+        )
+
+    def test_key_columns_are_categorical(self, engine):
+        """Test that repeated string keys use a shared categorical dtype"""
+        mobility = engine._generate_mobility_data()
+        spending, spending_wide = engine._generate_spending_data()
+        demographics = engine._generate_demographic_data()
+
+        for column in [mobility['county_fips'], mobility['county_name'],
+                       spending['county_fips'], spending['category'],
+                       demographics['county_fips']]:
+            assert isinstance(column.dtype, pd.CategoricalDtype)
+
+        assert mobility['county_fips'].dtype == spending['county_fips'].dtype
+        assert spending_wide.index.dtype == mobility['county_fips'].dtype
+
+    def test_comprehensive_analysis(self, engine):
+        """Test the end-to-end analysis output"""
+        results = engine.generate_comprehensive_analysis()
+
+        for key in ['personas', 'opportunities', 'insights', 'segmentation_results']:
+            assert key in results
+
+        profiles = results['segmentation_results']['cluster_profiles']
+        assert len(profiles) == 4
+        assert sum(profile['size'] for profile in profiles.values()) == 7
+        assert len(results['personas']) == len(profiles)
+
+        overview = results['insights']['market_overview']
+        assert overview['total_population'] == sum(
+            p['estimated_population'] for p in results['personas'].values()
+        )
+
+    def test_comprehensive_analysis_is_memoized(self, engine):
+        """Test that repeated analyses reuse the cached result and datasets"""
+        first = engine.generate_comprehensive_analysis()
+        second = engine.generate_comprehensive_analysis()
+
+        assert second['personas'] == first['personas']
+        assert second['insights'] == first['insights']
+        assert len(engine.data_cache) == 4
+        for key in ['mobility_data', 'spending_data', 'demographic_data']:
+            assert key in engine.data_cache
+
+    def test_comprehensive_analysis_returns_independent_copies(self, engine):
+        """Test that mutating a returned analysis does not alter later results"""
+        first = engine.generate_comprehensive_analysis()
+        persona = next(iter(first['personas'].values()))
+        original_name = persona['persona_name']
+
+        persona['persona_name'] = 'Mutated'
+        persona['seasonal_trends']['spring'] = -1.0
+        first['insights']['key_insights'].clear()
+
+        second = engine.generate_comprehensive_analysis()
+        assert second is not first
+        assert next(iter(second['personas'].values()))['persona_name'] == original_name
+        assert next(iter(second['personas'].values()))['seasonal_trends']['spring'] > 0
+        assert second['insights']['key_insights']
+        assert 'analysis_date' in second['data_summary']
+
+    def test_data_cache_is_bounded(self, engine):
+        """Test that the least recently used cache entries are evicted"""
+        for i in range(engine.CACHE_MAX_ENTRIES + 2):
+            engine._get_cached(f'key_{i}', lambda: i)
+
+        assert len(engine.data_cache) == engine.CACHE_MAX_ENTRIES
+        assert 'key_0' not in engine.data_cache
+        assert f'key_{engine.CACHE_MAX_ENTRIES + 1}' in engine.data_cache
+
+    def test_segmentation_model_is_reused(self, engine):
+        """Test that the fitted KMeans model is reused for unchanged inputs"""
+        mobility = engine._generate_mobility_data()
+        _, spending_wide = engine._generate_spending_data()
+
+        first = engine._perform_segmentation_analysis(mobility, spending_wide)
+        model = engine._kmeans
+        second = engine._perform_segmentation_analysis(mobility, spending_wide)
+
+        assert engine._kmeans is model
+        assert first['cluster_profiles'] == second['cluster_profiles']
+
+    def test_advanced_visualizations_match_personas(self, engine):
+        """Test that viz columns line up with the persona dict"""
+        results = engine.generate_comprehensive_analysis()
+        viz = engine.create_advanced_visualizations(results)
+
+        personas = list(results['personas'].values())
+        market = viz['market_analysis']
+        assert market['persona_names'] == [p['persona_name'] for p in personas]
+        assert market['market_values'] == [p['market_value'] for p in personas]
+        assert set(viz['seasonal_trends']) == set(market['persona_names'])
+
+        # Results without the precomputed frame still work
+        results_without_df = {k: v for k, v in results.items() if k != 'personas_df'}
+        assert engine.create_advanced_visualizations(results_without_df)['market_analysis'] == market
+
+    def test_generation_leaves_global_rng_untouched(self, engine):
+        """Test that generators use local Generators, not the global seed"""
+        state = np.random.get_state()
+        engine._generate_mobility_data()
+        engine._generate_spending_data()
+        engine._generate_demographic_data()
+        after = np.random.get_state()
+
+        assert state[0] == after[0]
+        assert np.array_equal(state[1], after[1])
+        assert state[2:] == after[2:]
+
+    def test_generated_numeric_columns_are_32_bit(self, engine):
+        """Test that generators emit compact int32/float32 columns"""
+        rounded = {'avg_trip_duration_minutes', 'member_ratio', 'spending_proportion'}
+        spending, spending_wide = engine._generate_spending_data()
+        for df in [engine._generate_mobility_data(), spending, spending_wide,
+                   engine._generate_demographic_data()]:
+            numeric = df.select_dtypes('number').drop(columns=rounded, errors='ignore')
+            assert set(numeric.dtypes.astype(str)) <= {'int32', 'float32'}
+
+    def test_rounded_columns_stay_exact(self, engine):
+        """Test that rounded display columns are not downcast into float noise"""
+        mobility = engine._generate_mobility_data()
+        spending, _ = engine._generate_spending_data()
+
+        for column, decimals in [(mobility['member_ratio'], 3),
+                                 (mobility['avg_trip_duration_minutes'], 1),
+                                 (spending['spending_proportion'], 3)]:
+            assert column.dtype == np.float64
+            assert column.tolist() == [round(value, decimals) for value in column.tolist()]
+
+        profiles = engine.generate_comprehensive_analysis()['segmentation_results']['cluster_profiles']
+        for profile in profiles.values():
+            if profile['size'] == 1:
+                assert profile['avg_member_ratio'] == round(profile['avg_member_ratio'], 3)
+                assert profile['avg_duration'] == round(profile['avg_duration'], 1)
+
+    def test_persona_seasonal_trends_within_bounds(self, engine):
+        """Test that batched seasonal multipliers stay in their noise bands"""
+        results = engine.generate_comprehensive_analysis()
+        bounds = {'spring': (0.9, 1.2), 'summer': (1.1, 1.5), 'fall': (0.8, 1.1), 'winter': (0.5, 0.8)}
+
+        for persona in results['personas'].values():
+            trends = persona['seasonal_trends']
+            assert list(trends) == list(bounds)
+            for season, (low, high) in bounds.items():
+                assert isinstance(trends[season], float)
+                assert low <= trends[season] <= high
+
+    def test_generators_use_independent_streams(self, engine):
+        """Test that generators do not replay each other's random draws"""
+        seeds = [AE._MOBILITY_SEED, AE._SPENDING_SEED, AE._DEMOGRAPHIC_SEED, AE._PERSONA_SEED]
+        first_draws = {np.random.default_rng(seed).standard_normal() for seed in seeds}
+        assert len(first_draws) == len(seeds)
+
+        # A shared seed made the income noise equal the mobility trip normals
+        demographics = engine._generate_demographic_data()
+        base_income = np.array([AE._COUNTY_DEMOGRAPHICS[county]['median_income'] for county in AE._COUNTIES])
+        income_normals = (demographics['median_income'].to_numpy() - base_income) / 5000
+        mobility_normals = np.random.default_rng(AE._MOBILITY_SEED).standard_normal(len(AE._COUNTIES))
+        assert not np.allclose(income_normals, mobility_normals, atol=1e-3)
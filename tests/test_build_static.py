@@ -0,0 +1,128 @@
+"""
+Tests for the static site build
+"""
+
+import gzip
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add the repository root to path for imports
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+import build_static
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() returns a settable build time"""
+    current = datetime(2024, 1, 1, 9, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+class TestBuildStatic:
+
+    @pytest.fixture
+    def build_dir(self, tmp_path, monkeypatch):
+        """Run builds from an empty directory with a controllable clock"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(build_static, 'datetime', _FixedDatetime)
+        monkeypatch.setattr(_FixedDatetime, 'current', datetime(2024, 1, 1, 9, 0, 0))
+        return tmp_path
+
+    def test_build_writes_site(self, build_dir):
+        """Test that a build emits the page, stylesheet and API"""
+        build_static.main()
+
+        dist = build_dir / 'dist'
+        assert 'January 01, 2024' in (dist / 'index.html').read_text(encoding='utf-8')
+        assert (dist / build_static.STYLESHEET_NAME).is_file()
+        # Root-absolute so nested paths rewritten to index.html still find it
+        assert f'href="/{build_static.STYLESHEET_NAME}"' in (dist / 'index.html').read_text(encoding='utf-8')
+        assert (dist / 'api' / 'analysis.json').is_file()
+
+        # The fingerprint lives beside dist/, not in the deployed output
+        assert (build_dir / build_static.CONTENT_HASH_FILE).is_file()
+        assert not any(path.name == build_static.CONTENT_HASH_FILE.name for path in dist.rglob('*'))
+
+    def test_unchanged_build_is_skipped(self, build_dir):
+        """Test that a rebuild on the same day keeps the existing output"""
+        build_static.main()
+        api_file = build_dir / 'dist' / 'api' / 'analysis.json'
+        first_api = api_file.read_bytes()
+
+        _FixedDatetime.current = datetime(2024, 1, 1, 17, 30, 0)
+        build_static.main()
+
+        assert api_file.read_bytes() == first_api
+
+    def test_new_build_date_triggers_rebuild(self, build_dir):
+        """Test that the page and API are refreshed on a later day"""
+        build_static.main()
+
+        _FixedDatetime.current = datetime(2024, 1, 2, 9, 0, 0)
+        build_static.main()
+
+        dist = build_dir / 'dist'
+        assert 'January 02, 2024' in (dist / 'index.html').read_text(encoding='utf-8')
+        assert '2024-01-02T09:00:00' in (dist / 'api' / 'analysis.json').read_text(encoding='utf-8')
+
+    def test_missing_output_triggers_rebuild(self, build_dir):
+        """Test that a partially deleted build is regenerated"""
+        build_static.main()
+        api_file = build_dir / 'dist' / 'api' / 'analysis.json'
+        api_file.unlink()
+
+        build_static.main()
+
+        assert api_file.is_file()
+
+    def test_fallback_replaces_precompressed_page(self, build_dir, monkeypatch):
+        """Test that a failed build leaves no stale compressed index"""
+        build_static.main()
+
+        precompress_assets = build_static.precompress_assets
+
+        def precompress_then_truncate(dist_dir):
+            precompress_assets(dist_dir)
+            (dist_dir / 'index.html').write_bytes(b'')
+
+        # Emptying index.html after precompression fails verification
+        monkeypatch.setattr(build_static, 'precompress_assets', precompress_then_truncate)
+        _FixedDatetime.current = datetime(2024, 1, 2, 9, 0, 0)
+        build_static.main()
+
+        dist = build_dir / 'dist'
+        assert (dist / 'index.html').read_bytes() == build_static._FALLBACK_HTML
+        assert gzip.decompress((dist / 'index.html.gz').read_bytes()) == build_static._FALLBACK_HTML
+        assert not (build_dir / build_static.CONTENT_HASH_FILE).exists()
+
+    def test_template_backends_render_demo_page_identically(self, build_dir, monkeypatch):
+        """Test that minijinja and Jinja2 produce the same page for the demo payload"""
+        pytest.importorskip('minijinja')
+        pytest.importorskip('jinja2')
+        analysis_results = build_static.create_minimal_demo_data('2024-01-01T09:00:00')
+
+        pages = {}
+        for native in (True, False):
+            monkeypatch.setattr(build_static, 'MINIJINJA_AVAILABLE', native)
+            out_dir = build_dir / ('native' if native else 'jinja2')
+            out_dir.mkdir()
+            build_static.create_static_html(analysis_results, out_dir, 'January 01, 2024')
+            pages[native] = (out_dir / 'index.html').read_bytes()
+
+        assert pages[True] == pages[False]
+
+    def test_demo_data_copies_do_not_share_state(self):
+        """Test that mutating one demo payload leaves later builds untouched"""
+        first = build_static.create_minimal_demo_data('2024-01-01T09:00:00')
+        first['personas']['urban_commuter']['persona_name'] = 'Mutated'
+        first['insights']['key_insights'].clear()
+
+        second = build_static.create_minimal_demo_data('2024-01-02T09:00:00')
+        assert second['personas']['urban_commuter']['persona_name'] == 'Urban Commuter Pro'
+        assert second['insights']['key_insights']
+        assert second['generated_at'] == '2024-01-02T09:00:00'